@@ -0,0 +1,9 @@
+"""
+Convenient constants for use in Regex.
+
+The `Regex` wrapped constants from `iregex.consts.regex` are re-exported here.
+The raw pattern strings live in `iregex.consts.strings`.
+"""
+
+from iregex.consts.regex import *  # noqa: F403, F401
+from iregex.consts.regex import __all__  # noqa: F401
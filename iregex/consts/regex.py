@@ -0,0 +1,98 @@
+"""
+Convenient constants for use in Regex, wrapped as `Regex` objects.
+"""
+
+from iregex.consts import strings as _strings
+from iregex.regex import Regex
+
+__all__ = [
+    "WHITESPACE",
+    "NON_WHITESPACE",
+    "LOWERCASE",
+    "UPPERCASE",
+    "ALPHA",
+    "NUMERIC",
+    "NON_NUMERIC",
+    "ALPHA_NUMERIC",
+    "NON_ALPHANUMERIC",
+    "ANY_CHAR",
+    "ANYTHING",
+    "PERIOD",
+    "START_OF_LINE",
+    "END_OF_LINE",
+    "ONE_OR_MORE",
+    "ZERO_OR_MORE",
+    "OPTIONAL",
+    "PLUS",
+    "ASTERISK",
+    "DOLLAR",
+    "QUESTION_MARK",
+    "NEWLINE",
+]
+
+#: Any whitespace character
+WHITESPACE = Regex(_strings.WHITESPACE)
+
+#: Any non-whitespace character
+NON_WHITESPACE = Regex(_strings.NON_WHITESPACE)
+
+#: Any lowercase character a-z
+LOWERCASE = Regex(_strings.LOWERCASE)
+
+#: Any uppercase character A-Z
+UPPERCASE = Regex(_strings.UPPERCASE)
+
+#: Any lower or uppercase character a-z A-Z
+ALPHA = Regex(_strings.ALPHA)
+
+#: Any numeric character 0-9
+NUMERIC = Regex(_strings.NUMERIC)
+
+#: Any non-numeric character
+NON_NUMERIC = Regex(_strings.NON_NUMERIC)
+
+#: Any alphanumeric character a-z or 0-9
+ALPHA_NUMERIC = Regex(_strings.ALPHA_NUMERIC)
+
+#: Any non-alphanumeric character
+NON_ALPHANUMERIC = Regex(_strings.NON_ALPHANUMERIC)
+
+#: Any character at all
+ANY_CHAR = Regex(_strings.ANY_CHAR)
+
+#: Any number of any character at all
+ANYTHING = Regex(_strings.ANYTHING)
+
+#: The literal period
+PERIOD = Regex(_strings.PERIOD)
+
+#: The start of a line
+START_OF_LINE = Regex(_strings.START_OF_LINE)
+
+#: The end of a line
+END_OF_LINE = Regex(_strings.END_OF_LINE)
+
+#: One or more of the last character or group
+ONE_OR_MORE = Regex(_strings.ONE_OR_MORE)
+
+#: Zero or more of the last character or group
+ZERO_OR_MORE = Regex(_strings.ZERO_OR_MORE)
+
+#: Zero or one of the last character or group
+OPTIONAL = Regex(_strings.OPTIONAL)
+
+#: Literal Plus
+PLUS = Regex(_strings.PLUS)
+
+#: Literal ASTERISK
+ASTERISK = _strings.ASTERISK
+
+#: Literal Dollar Sign
+DOLLAR = _strings.DOLLAR
+
+#: Literal Question Mark
+QUESTION_MARK = _strings.QUESTION_MARK
+
+#: Indicates a newline, use in `re.MULTILINE` mode.
+#: Supports all operating systems
+NEWLINE = _strings.NEWLINE
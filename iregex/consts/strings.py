@@ -1,62 +1,60 @@
 """
-Convenient constants for use in Regex.
+Convenient constants for use in Regex, as raw pattern strings.
 """
 
-from iregex.regex import Regex
-
 #: Any whitespace character
-WHITESPACE = Regex(r"\s")
+WHITESPACE = r"\s"
 
 #: Any non-whitespace character
-NON_WHITESPACE = Regex(r"\S")
+NON_WHITESPACE = r"\S"
 
 #: Any lowercase character a-z
-LOWERCASE = Regex(r"[a-z]")
+LOWERCASE = r"[a-z]"
 
 #: Any uppercase character A-Z
-UPPERCASE = Regex(r"[A-Z]")
+UPPERCASE = r"[A-Z]"
 
 #: Any lower or uppercase character a-z A-Z
-ALPHA = Regex(r"[a-zA-Z]")
+ALPHA = r"[a-zA-Z]"
 
 #: Any numeric character 0-9
-NUMERIC = Regex(r"\d")
+NUMERIC = r"\d"
 
 #: Any non-numeric character
-NON_NUMERIC = Regex(r"\D")
+NON_NUMERIC = r"\D"
 
 #: Any alphanumeric character a-z or 0-9
-ALPHA_NUMERIC = Regex(r"\w")
+ALPHA_NUMERIC = r"\w"
 
 #: Any non-alphanumeric character
-NON_ALPHANUMERIC = Regex(r"\W")
+NON_ALPHANUMERIC = r"\W"
 
 #: Any character at all
-ANY_CHAR = Regex(r".")
+ANY_CHAR = r"."
 
 #: Any number of any character at all
-ANYTHING = Regex(r".*")
+ANYTHING = r".*"
 
 #: The literal period
-PERIOD = Regex(r"\.")
+PERIOD = r"\."
 
 #: The start of a line
-START_OF_LINE = Regex(r"^")
+START_OF_LINE = r"^"
 
 #: The end of a line
-END_OF_LINE = Regex(r"$")
+END_OF_LINE = r"$"
 
 #: One or more of the last character or group
-ONE_OR_MORE = Regex(r"+")
+ONE_OR_MORE = r"+"
 
 #: Zero or more of the last character or group
-ZERO_OR_MORE = Regex(r"*")
+ZERO_OR_MORE = r"*"
 
 #: Zero or one of the last character or group
-OPTIONAL = Regex(r"?")
+OPTIONAL = r"?"
 
 #: Literal Plus
-PLUS = Regex(r"\+")
+PLUS = r"\+"
 
 #: Literal ASTERISK
 ASTERISK = r"\*"
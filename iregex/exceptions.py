@@ -6,28 +6,34 @@ Custom exceptions used in this library.
 class SetIntersectionError(Exception):
     """Happens when the intersection of two sets is non-empty."""
 
-    pass
+    __slots__ = ()
 
 
 class NonEmptyError(Exception):
     """Happens when something that is supposed to be empty is not."""
 
-    pass
+    __slots__ = ()
 
 
 class NotACharacterException(Exception):
     """Happens when something that should have been a character is not a character."""
 
-    pass
+    __slots__ = ()
 
 
 class AlreadyRepeatingException(Exception):
     """Happens when a repeating character is already at the end of the regex."""
 
-    pass
+    __slots__ = ()
 
 
 class AlreadyCapturedException(Exception):
     """Happens when a capture group already exists and can't be replaced."""
 
-    pass
+    __slots__ = ()
+
+
+class UnsupportedForDFAException(Exception):
+    """Happens when a regex uses features that a DFA based engine can't match."""
+
+    __slots__ = ()
@@ -1,18 +1,154 @@
 """
 This is the module containing the main Regex class.
 """
+import os
 import re
-from copy import copy
-from typing import Any, List, Optional, Union
-
+import sys
+from enum import IntEnum
+from importlib import import_module
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union, cast
+
+from iregex.consts.strings import ANYTHING as _ANYTHING
+from iregex.consts.strings import NEWLINE as _NEWLINE
+from iregex.consts.strings import ONE_OR_MORE as _ONE_OR_MORE
+from iregex.consts.strings import OPTIONAL as _OPTIONAL
+from iregex.consts.strings import WHITESPACE as _WHITESPACE
+from iregex.consts.strings import ZERO_OR_MORE as _ZERO_OR_MORE
 from iregex.exceptions import (
     AlreadyCapturedException,
     AlreadyRepeatingException,
     NonEmptyError,
     NotACharacterException,
     SetIntersectionError,
+    UnsupportedForDFAException,
 )
 
+__all__ = [
+    "Regex",
+    "RegexBuilder",
+    "Literal",
+    "ZeroOrMore",
+    "OneOrMore",
+    "MOrMore",
+    "MToN",
+    "Option",
+    "Or",
+    "Lookahead",
+    "Lookbehind",
+    "NegativeLookahead",
+    "NegativeLookbehind",
+    "CaptureGroup",
+    "NamedCaptureGroup",
+    "NonCaptureGroup",
+    "AnyChar",
+    "ExcludeChar",
+    # The exceptions have always been importable from the top level iregex package
+    "AlreadyCapturedException",
+    "AlreadyRepeatingException",
+    "NonEmptyError",
+    "NotACharacterException",
+    "SetIntersectionError",
+    "UnsupportedForDFAException",
+]
+
+# Shared by every Regex without named capture groups
+_EMPTY_CG: FrozenSet[str] = frozenset()
+
+# Optional regex engines usable by Regex.compile, and the package providing each
+_OPTIONAL_ENGINES = {"regex": "regex", "pcre": "python-pcre", "re2": "google-re2"}
+
+# The engine Regex.compile uses when none is given
+_DEFAULT_ENGINE = os.environ.get("IREGEX_ENGINE", "re")
+
+# The regex engines imported so far, by name
+_ENGINES: Dict[str, Any] = {"re": re}
+
+
+def _get_engine(engine: str) -> Any:
+    """
+    Imports the named regex engine the first time it is asked for.
+
+    :raises ValueError: If the engine is not one of the supported engines.
+    :raises ImportError: If the engine is supported but not installed.
+    """
+    module = _ENGINES.get(engine)
+    if module is None:
+        if engine not in _OPTIONAL_ENGINES:
+            raise ValueError(f"Unrecognized engine: {engine}")
+        try:
+            module = import_module(engine)
+        except ImportError as e:
+            raise ImportError(
+                f"The {engine} engine requires `pip install {_OPTIONAL_ENGINES[engine]}`."
+            ) from e
+        _ENGINES[engine] = module
+    return module
+
+
+# Compiled patterns shared by every Regex with the same string, keyed like Regex._compiled
+_COMPILE_CACHE: Dict[Tuple, Any] = {}
+_COMPILE_CACHE_MAXSIZE = 4096
+
+# Matches lookarounds and backreferences, which DFA based engines don't support.
+# They only count after an even number of backslashes, otherwise they are escaped.
+_DFA_UNSUPPORTED_RE = re.compile(r"(?<!\\)(?:\\\\)*(?:\(\?<?[=!]|\(\?P=|\\[1-9])")
+
+# The characters a repeating regex ends with
+_REPEAT_SUFFIXES = (_OPTIONAL, _ZERO_OR_MORE, _ONE_OR_MORE, r"}")
+
+# Brace quantifiers for small counts, which are by far the most common, built once
+_SMALL_REPS = 16
+_EXACTLY_M = tuple(f"{{{m}}}" for m in range(_SMALL_REPS))
+_M_OR_MORE = tuple(f"{{{m},}}" for m in range(_SMALL_REPS))
+_M_TO_N = {
+    (m, n): f"{{{m},{n}}}" for m in range(_SMALL_REPS) for n in range(m, _SMALL_REPS)
+}
+
+# The characters which may start a quantifier, binding it to the character before
+_QUANTIFIER_STARTS = (_ZERO_OR_MORE, _ONE_OR_MORE, _OPTIONAL, r"{")
+
+# The characters with a special meaning outside of character groups
+_METACHARS = frozenset(r".^$*+?{}[]\|()")
+
+# Characters whose meaning in a character group depends on where they are:
+# "-" makes a range of its neighbours, a lone "\\" escapes the next character,
+# "^" negates the group when first and "]" is literal when first
+_POSITIONAL_CLASS_CHARS = frozenset(("-", "\\", "^", "]"))
+
+# Matches a single, possibly escaped, character.
+_CHAR_RE = re.compile(r"\\?.\Z", re.DOTALL)
+
+
+class _Kind(IntEnum):
+    """The structural kinds of regex string that the group builders care about."""
+
+    CHAR = 0
+    CHAR_GROUP = 1
+    CAPTURE = 2
+    NON_CAPTURE = 3
+    NAMED_CAPTURE = 4
+    OTHER = 5
+
+
+# How each kind of group is opened and closed
+_OPEN = sys.intern(r"(")
+_CLOSE = sys.intern(r")")
+_OR = sys.intern(r"|")
+_NC_OPEN = sys.intern(r"(?:")
+_NAMED_OPEN = sys.intern(r"(?<")
+_LOOKAHEAD_OPEN = sys.intern(r"(?=")
+_LOOKBEHIND_OPEN = sys.intern(r"(?<=")
+_NEGATIVE_LOOKAHEAD_OPEN = sys.intern(r"(?!")
+_NEGATIVE_LOOKBEHIND_OPEN = sys.intern(r"(?<!")
+
+# What anything, whitespace and newlines append, built once
+_ANY_STAR = sys.intern(_ANYTHING)
+_WS_STAR = sys.intern(_WHITESPACE + _ZERO_OR_MORE)
+_NL_STAR = sys.intern(_NEWLINE + _ZERO_OR_MORE)
+
+# How many characters open each kind of unnamed group
+_GROUP_PREFIX_LEN = {_Kind.CAPTURE: len(_OPEN), _Kind.NON_CAPTURE: len(_NC_OPEN)}
+
 
 class Regex:
     """
@@ -35,23 +171,63 @@ class Regex:
     :param regex_str: An optional literal to start your Regex with.
     """
 
+    __slots__ = (
+        "_str",
+        "_capture_groups",
+        "_compiled",
+        "_finalized",
+    )
+
     # Private Variables
-    _data: List[str]
-    _capture_groups: List[str]
+    _str: str
+    _capture_groups: FrozenSet[str]
+    _compiled: Optional[Dict[Tuple, Any]]
+    _finalized: Optional[Any]
 
     def __init__(self, regex_str: Optional[Union["Regex", str]] = None) -> None:
         """Optionally can take a literal as input."""
         if isinstance(regex_str, Regex):
             regex_str = str(regex_str)
-        self._data = [regex_str] if regex_str else []
-        self._capture_groups = []
+        self._str = regex_str or ""
+        self._capture_groups = _EMPTY_CG
+        self._compiled = None
+        self._finalized = None
+
+    @staticmethod
+    def _wrap(regex_str: str, capture_groups: FrozenSet[str] = _EMPTY_CG) -> "Regex":
+        """
+        Makes a Regex from an already built string without going through `__init__`.
+
+        :param regex_str: The finished regex string.
+        :param capture_groups: The names of the capture groups in regex_str.
+        """
+        out = object.__new__(Regex)
+        out._str = regex_str
+        out._capture_groups = capture_groups
+        out._compiled = None
+        out._finalized = None
+        return out
+
+    def _clone(self) -> "Regex":
+        """Makes a shallow copy without going through `copy.copy` or `__init__`."""
+        return Regex._wrap(self._str, self._capture_groups)
+
+    def _with_suffix(self, token: str, group: bool = False) -> "Regex":
+        """
+        Makes a new Regex with token appended, sharing the capture groups by reference.
+
+        :param token: The string to append.
+        :param group: Whether to first make a non capture group so the token applies to all of it.
+        :raises AlreadyCapturedException: If group is set and this is already a named capture group.
+        """
+        prefix = self._non_capture_str() if group else self._str
+        return Regex._wrap(prefix + token, self._capture_groups)
 
     # ============== Chained Methods ==============
     @staticmethod
     def _is_repeating(txt: Union[str, "Regex"]) -> bool:
         """Tests if a regex string is repeating."""
-        txt_: str = str(txt) if isinstance(txt, Regex) else txt
-        return txt_[-1] in (r"?", r"*", r"+", r"}")
+        return str(txt).endswith(_REPEAT_SUFFIXES)
 
     def zero_or_more_repetitions(self) -> "Regex":
         """
@@ -75,10 +251,8 @@ class Regex:
         :raises AlreadyRepeatingException: If this is already a repeating regex.
         """
         if Regex._is_repeating(self):
-            raise AlreadyRepeatingException("{self} is already repeating.")
-        out = self.make_non_capture_group()
-        out._data.append(r"*")
-        return out
+            raise AlreadyRepeatingException(f"{self} is already repeating.")
+        return self._with_suffix(_ZERO_OR_MORE, group=True)
 
     def one_or_more_repetitions(self) -> "Regex":
         """
@@ -102,10 +276,49 @@ class Regex:
         :raises AlreadyRepeatingException: If this is already a repeating regex.
         """
         if Regex._is_repeating(self):
-            raise AlreadyRepeatingException("{self} is already repeating.")
-        out = self.make_non_capture_group()
-        out._data.append(r"+")
-        return out
+            raise AlreadyRepeatingException(f"{self} is already repeating.")
+        return self._with_suffix(_ONE_OR_MORE, group=True)
+
+    def repeat(self, m: int, n: Optional[int] = None, greedy: bool = True) -> "Regex":
+        """
+        Repeats the previous regex exactly m times, or m to n inclusive times.
+
+        The brace quantifier is built and appended in a single step.
+
+        .. testsetup::
+
+            from iregex import Regex
+
+        .. doctest::
+
+            >>> Regex("a").repeat(3)
+            Regex(r"a{3}")
+
+            >>> Regex("hello world").repeat(3, 5)
+            Regex(r"(?:hello world){3,5}")
+
+            >>> Regex("a").repeat(0, 1)
+            Regex(r"a?")
+
+            >>> Regex("a").repeat(3, 5, greedy=False)
+            Regex(r"a{3,5}?")
+
+        :param m: Exactly this many times, or at least this many times if n is given.
+        :param n: At most this many times (inclusive).
+        :param greedy: Whether to match as many repetitions as possible, rather than as few.
+        :raises AlreadyRepeatingException: If this is already a repeating regex.
+        """
+        if Regex._is_repeating(self):
+            raise AlreadyRepeatingException(f"{self} is already repeating.")
+        if n is None:
+            token = _EXACTLY_M[m] if 0 <= m < _SMALL_REPS else f"{{{m}}}"
+        elif m == 0 and n == 1:
+            token = _OPTIONAL
+        else:
+            token = _M_TO_N.get((m, n)) or f"{{{m},{n}}}"
+        if not greedy:
+            token += _OPTIONAL
+        return self._with_suffix(token, group=True)
 
     def m_to_n_repetitions(self, m: int, n: int) -> "Regex":
         """
@@ -133,14 +346,7 @@ class Regex:
         :param n: At most this many times (inclusive).
         :raises AlreadyRepeatingException: If this is already a repeating regex.
         """
-        if Regex._is_repeating(self):
-            raise AlreadyRepeatingException("{self} is already repeating.")
-        out = self.make_non_capture_group()
-        if m == 0 and n == 1:
-            out._data.append(r"?")
-        else:
-            out._data.append("{" + str(m) + "," + str(n) + "}")
-        return out
+        return self.repeat(m, n)
 
     def exactly_m_repetitions(self, m: int) -> "Regex":
         """
@@ -164,11 +370,7 @@ class Regex:
         :param m: Exactly this many instances.
         :raises AlreadyRepeatingException: If this is already a repeating regex.
         """
-        if Regex._is_repeating(self):
-            raise AlreadyRepeatingException("{self} is already repeating.")
-        out = self.make_non_capture_group()
-        out._data.append("{" + str(m) + "}")
-        return out
+        return self.repeat(m)
 
     def m_or_more_repetitions(self, m: int) -> "Regex":
         """
@@ -199,17 +401,16 @@ class Regex:
         :raises ValueError: When m < 0
         :raises AlreadyRepeatingException: If this is already a repeating regex.
         """
-        if Regex._is_repeating(self):
-            raise AlreadyRepeatingException("{self} is already repeating.")
-        if m == 0:
-            return self.zero_or_more_repetitions()
-        elif m == 1:
-            return self.one_or_more_repetitions()
-        elif m < 0:
+        if m < 0:
             raise ValueError(f"m must be >= 0, got {m}")
-        out = self.make_non_capture_group()
-        out._data.append("{" + str(m) + ",}")
-        return out
+        if m >= 2:
+            if Regex._is_repeating(self):
+                raise AlreadyRepeatingException(f"{self} is already repeating.")
+            token = _M_OR_MORE[m] if m < _SMALL_REPS else f"{{{m},}}"
+            return self._with_suffix(token, group=True)
+        if m == 1:
+            return self.one_or_more_repetitions()
+        return self.zero_or_more_repetitions()
 
     def optional(self) -> "Regex":
         """
@@ -233,20 +434,102 @@ class Regex:
         :raises AlreadyRepeatingException: If this is already a repeating regex.
         """
         if Regex._is_repeating(self):
-            raise AlreadyRepeatingException("{self} is already repeating.")
-        out = self.make_non_capture_group()
-        out._data.append(r"?")
-        return out
+            raise AlreadyRepeatingException(f"{self} is already repeating.")
+        return self._with_suffix(_OPTIONAL, group=True)
+
+    def literal(self, regex: Union["Regex", str]) -> "Regex":
+        """
+        Appends a literal string or another Regex.
+
+        .. testsetup::
+
+            from iregex import Regex
+
+        .. doctest::
+
+            >>> Regex("hello").literal(" ").literal(Regex("world"))
+            Regex(r"hello world")
+
+        :param regex: The string or Regex to append.
+        :raises SetIntersectionError: If the two _capture_groups share any values.
+        :raises TypeError: If regex is not either a Regex or a string.
+        """
+        if type(regex) is str:
+            return self._with_suffix(regex)
+        return Regex._concat(self, Regex._coerce(regex))
+
+    def anything(self) -> "Regex":
+        """
+        Appends any number of any character.
+
+        .. testsetup::
+
+            from iregex import Regex
+
+        .. doctest::
+
+            >>> Regex("hello").anything()
+            Regex(r"hello.*")
+
+        """
+        return self._with_suffix(_ANY_STAR)
+
+    def whitespace(self) -> "Regex":
+        r"""
+        Appends any amount of whitespace, including none at all.
+
+        .. testsetup::
+
+            from iregex import Regex
+
+        .. doctest::
+
+            >>> Regex("hello").whitespace() + "world"
+            Regex(r"hello\s*world")
+
+        """
+        return self._with_suffix(_WS_STAR)
+
+    def newlines(self) -> "Regex":
+        r"""
+        Appends any number of newlines from any operating system, including none at all.
+
+        .. testsetup::
+
+            from iregex import Regex
+
+        .. doctest::
+
+            >>> Regex("hello").newlines() + "world"
+            Regex(r"hello(?:\n|\r\n?)*world")
+
+        """
+        return self._with_suffix(_NL_STAR)
 
     @staticmethod
-    def _is_character(txt: Union[str, "Regex"]) -> bool:
-        """Tests if a regex string is just a single character."""
-        txt_: str = str(txt) if isinstance(txt, Regex) else txt
-        if len(txt_) == 1:
-            return True
-        if len(txt_) == 2 and txt_[0] == "\\":
-            return True
-        return False
+    def _join_chars(char: Tuple[Union["Regex", str], ...]) -> str:
+        """
+        Joins characters into the body of a character group, converting each only once.
+
+        Repeated characters are dropped, keeping the first of each,
+        unless the group has a character whose meaning depends on its position.
+        The order is always kept since sorting could turn `^` or `-` into syntax.
+
+        :raises NotACharacterException: Raised if any argument is not a character.
+        """
+        chars = [str(t) for t in char]
+        joined = "".join(chars)
+        # Without empty strings, the lengths only add up if every one is a single character
+        if len(joined) != len(chars) or "" in chars:
+            match = _CHAR_RE.match
+            for t in chars:
+                if match(t) is None:
+                    raise NotACharacterException(fr"{t} is not a character.")
+        if _POSITIONAL_CLASS_CHARS.isdisjoint(chars):
+            unique = dict.fromkeys(chars)
+            if len(unique) < len(chars):
+                return "".join(unique)
+        return joined
 
     def any_char(self, *char: Union["Regex", str]) -> "Regex":
         """
@@ -263,21 +546,17 @@ class Regex:
             >>> Regex().any_char('a')
             Regex(r"a")
 
+            >>> Regex("hello").any_char('s')
+            Regex(r"hellos")
+
             >>> Regex("hello").any_char('w', 'o', 'r', 'l', 'd')
             Regex(r"hello[world]")
 
         :param char: Some character.
         :raises NotACharacterException: Raised if any argument is not a character.
         """
-        out = copy(self)
-        for t in char:
-            if not Regex._is_character(t):
-                raise NotACharacterException(fr"{t} is not a character.")
-        if len(char) > 1:
-            out._data += ["["] + [str(c) for c in char] + ["]"]
-        else:
-            out._data = [str(c) for c in char]
-        return out
+        body = Regex._join_chars(char)
+        return self._with_suffix(f"[{body}]" if len(char) > 1 else body)
 
     def exclude_char(self, *char: Union["Regex", str]) -> "Regex":
         """
@@ -297,48 +576,32 @@ class Regex:
         :param char: Some character.
         :raises NotACharacterException: Raised if any argument is not a character.
         """
-        out = copy(self)
-        for t in char:
-            if not Regex._is_character(t):
-                raise NotACharacterException(fr"{t} is not a character.")
-        out._data += ["[^"] + [str(c) for c in char] + ["]"]
-        return out
+        body = Regex._join_chars(char)
+        return self._with_suffix(f"[^{body}]")
 
     @staticmethod
-    def _is_character_group(txt: Union[str, "Regex"]) -> bool:
-        """Tests if a regex string is a character group."""
-        txt_: str = str(txt) if isinstance(txt, Regex) else txt
-        if len(txt_) >= 2 and txt_[0] == r"[" and txt_[-1] == r"]":
-            return True
-        return False
+    def _classify(txt: str) -> "_Kind":
+        """Classifies a regex string by inspecting only its ends and length."""
+        n = len(txt)
+        if n == 1 or (n == 2 and txt[0] == "\\"):
+            return _Kind.CHAR
+        if n >= 2:
+            first, last = txt[0], txt[-1]
+            if first == r"[" and last == r"]":
+                return _Kind.CHAR_GROUP
+            if first == _OPEN and last == _CLOSE:
+                head = txt[0:3]
+                if n >= 5 and head == _NAMED_OPEN:
+                    return _Kind.NAMED_CAPTURE
+                if n >= 4 and head == _NC_OPEN:
+                    return _Kind.NON_CAPTURE
+                return _Kind.CAPTURE
+        return _Kind.OTHER
 
     @staticmethod
-    def _is_named_capture_group(txt: Union[str, "Regex"]) -> bool:
-        """Tests if a regex string is a named capture group."""
-        txt_: str = str(txt) if isinstance(txt, Regex) else txt
-        if len(txt_) >= 5 and txt_[0:3] == r"(?<" and txt_[-1] == r")":
-            return True
-        return False
-
-    @staticmethod
-    def _is_non_capture_group(txt: Union[str, "Regex"]) -> bool:
-        """Tests if a regex string is a non capture group."""
-        txt_: str = str(txt) if isinstance(txt, Regex) else txt
-        if not Regex._is_named_capture_group(txt):
-            if len(txt_) >= 4 and txt_[0:3] == r"(?:" and txt_[-1] == r")":
-                return True
-        return False
-
-    @staticmethod
-    def _is_capture_group(txt: Union[str, "Regex"]) -> bool:
-        """Tests if a regex string is a capture group."""
-        txt_: str = str(txt) if isinstance(txt, Regex) else txt
-        if not Regex._is_named_capture_group(txt) and not Regex._is_non_capture_group(
-            txt
-        ):
-            if len(txt_) >= 2 and txt_[0] == r"(" and txt_[-1] == r")":
-                return True
-        return False
+    def _group_body(txt: str, kind: "_Kind") -> str:
+        """Strips the brackets off of a capture or non capture group of the given kind."""
+        return txt[_GROUP_PREFIX_LEN[kind] : -1]
 
     def make_capture_group(self) -> "Regex":
         """
@@ -361,16 +624,16 @@ class Regex:
 
         :raises AlreadyCapturedException: If this is already a named capture group.
         """
-        if Regex._is_named_capture_group(self):
+        kind = Regex._classify(self._str)
+        if kind is _Kind.NAMED_CAPTURE:
             raise AlreadyCapturedException(f"This is already a capture group: {self}")
-        if Regex._is_capture_group(self):
+        if kind is _Kind.CAPTURE:
             return self
-        out = copy(self)
-        if Regex._is_non_capture_group(self):
-            out._data = ["(", str(out)[3:-1], ")"]
+        if kind is _Kind.NON_CAPTURE:
+            body = Regex._group_body(self._str, kind)
         else:
-            out._data = ["("] + out._data + [")"]
-        return out
+            body = self._str
+        return Regex._wrap(_OPEN + body + _CLOSE, self._capture_groups)
 
     def make_non_capture_group(self) -> "Regex":
         """
@@ -396,21 +659,23 @@ class Regex:
 
         :raises AlreadyCapturedException: If this is already a named capture group.
         """
-        out = copy(self)
+        return Regex._wrap(self._non_capture_str(), self._capture_groups)
+
+    def _non_capture_str(self) -> str:
+        """
+        The regex string of `make_non_capture_group`, without building a new Regex.
+
+        :raises AlreadyCapturedException: If this is already a named capture group.
+        """
+        kind = Regex._classify(self._str)
         # You don't need to make a non_capture_group for simple cases
-        if (
-            Regex._is_character(self)
-            or Regex._is_character_group(self)
-            or Regex._is_non_capture_group(self)
-        ):
-            out._data = out._data
-        elif Regex._is_named_capture_group(self):
+        if kind in (_Kind.CHAR, _Kind.CHAR_GROUP, _Kind.NON_CAPTURE):
+            return self._str
+        if kind is _Kind.NAMED_CAPTURE:
             raise AlreadyCapturedException(f"This is already a capture group: {self}")
-        elif Regex._is_capture_group(self):
-            out._data = ["(?:", str(out)[1:-1], ")"]
-        else:
-            out._data = ["(?:"] + out._data + [")"]
-        return out
+        if kind is _Kind.CAPTURE:
+            return _NC_OPEN + Regex._group_body(self._str, kind) + _CLOSE
+        return _NC_OPEN + self._str + _CLOSE
 
     def make_named_capture_group(self, name: str) -> "Regex":
         """
@@ -434,17 +699,16 @@ class Regex:
         :param name: The name to assign the capture group.
         :raises AlreadyCapturedException: If this is already a named capture group.
         """
-        out = copy(self)
-        if Regex._is_non_capture_group(self):
-            out._data = ["(?<", name, ">", str(out)[3:-1], ")"]
-        elif Regex._is_capture_group(self):
-            out._data = ["(?<", name, ">", str(out)[1:-1], ")"]
-        elif Regex._is_named_capture_group(self):
+        kind = Regex._classify(self._str)
+        if kind is _Kind.NON_CAPTURE or kind is _Kind.CAPTURE:
+            body = Regex._group_body(self._str, kind)
+        elif kind is _Kind.NAMED_CAPTURE:
             raise AlreadyCapturedException(f"{self} is already a named capture group.")
         else:
-            out._data = ["(?<", name, ">"] + out._data + [")"]
-            out._capture_groups.append(name)
-        return out
+            body = self._str
+        return Regex._wrap(
+            f"{_NAMED_OPEN}{name}>{body}{_CLOSE}", self._capture_groups | {name}
+        )
 
     def make_lookahead(self) -> "Regex":
         """
@@ -460,9 +724,7 @@ class Regex:
             Regex(r"hello(?=world)")
 
         """
-        out = copy(self)
-        out._data = ["(?="] + self._data + [")"]
-        return out
+        return Regex._wrap(_LOOKAHEAD_OPEN + self._str + _CLOSE, self._capture_groups)
 
     def make_lookbehind(self) -> "Regex":
         """
@@ -478,9 +740,7 @@ class Regex:
             Regex(r"(?<=hello)world")
 
         """
-        out = copy(self)
-        out._data = ["(?<="] + self._data + [")"]
-        return out
+        return Regex._wrap(_LOOKBEHIND_OPEN + self._str + _CLOSE, self._capture_groups)
 
     def make_negative_lookahead(self) -> "Regex":
         """
@@ -496,9 +756,9 @@ class Regex:
             Regex(r"hello(?!world)")
 
         """
-        out = copy(self)
-        out._data = ["(?!"] + self._data + [")"]
-        return out
+        return Regex._wrap(
+            _NEGATIVE_LOOKAHEAD_OPEN + self._str + _CLOSE, self._capture_groups
+        )
 
     def make_negative_lookbehind(self) -> "Regex":
         """
@@ -514,137 +774,321 @@ class Regex:
             Regex(r"(?<!hello)world")
 
         """
-        out = copy(self)
-        out._data = ["(?<!"] + self._data + [")"]
-        return out
+        return Regex._wrap(
+            _NEGATIVE_LOOKBEHIND_OPEN + self._str + _CLOSE, self._capture_groups
+        )
+
+    def builder(self) -> "RegexBuilder":
+        """
+        Starts a `RegexBuilder` from this Regex, for cheaply building long chains in place.
+
+        .. testsetup::
+
+            from iregex import Regex
+
+        .. doctest::
+
+            >>> Regex("a").builder().literal("b").one_or_more_repetitions().build()
+            Regex(r"(?:ab)+")
+
+        """
+        return RegexBuilder(self)
 
     # ============== Result Methods =============
-    def compile(self, *args: Any, **kwargs: Any) -> re.Pattern:
+    def compile(
+        self, *args: Any, engine: Optional[str] = None, **kwargs: Any
+    ) -> Any:
         """
-        A simple wrapper around re.compile.
+        Compiles this regex with re, or with another engine's `compile`.
+
+        The compiled pattern is cached on this object, so calling this repeatedly
+        with the same parameters is cheap.
+        It is also shared with every other Regex built to the same string.
+        On a Regex returned by `finalized` calling this without parameters is cheaper still.
+
+        Other regex engines with the same `compile` interface may be selected with `engine`,
+        in which case that engine's pattern object is returned.
+        `"regex"` uses the `regex <https://pypi.org/project/regex/>`_ package
+        and `"pcre"` uses the `python-pcre <https://pypi.org/project/python-pcre/>`_ bindings,
+        neither of which are installed by default. See `compile_dfa` for `"re2"`.
+        The default engine is `"re"`, unless the `IREGEX_ENGINE` environment variable
+        names another one when iregex is imported.
 
         :param args: Positional parameters to pass to re.compile.
+        :param engine: The name of the module to compile with,
+            one of `"re"`, `"regex"`, `"pcre"` or `"re2"`.
         :param kwargs: Keyword parameters to pass to re.compile.
+        :raises ValueError: If the engine is not one of the supported engines.
+        :raises ImportError: If the engine is supported but not installed.
+        """
+        # Only a call without any parameters, not even engine, gets the finalized pattern
+        if engine is None:
+            if self._finalized is not None and not args and not kwargs:
+                return self._finalized
+            engine = _DEFAULT_ENGINE
+        key: Tuple = (engine, args)
+        if kwargs:
+            key += (tuple(sorted(kwargs.items())),)
+        compiled = self._compiled
+        try:
+            if compiled is not None:
+                pattern = compiled.get(key)
+                if pattern is not None:
+                    return pattern
+            shared_key = (self._str,) + key
+            pattern = _COMPILE_CACHE.get(shared_key)
+        except TypeError:
+            # Unhashable parameters, like the named lists of the regex package,
+            # can't be part of a cache key, so compile without caching
+            return _get_engine(engine).compile(self._str, *args, **kwargs)
+        if pattern is None:
+            pattern = _get_engine(engine).compile(self._str, *args, **kwargs)
+            if len(_COMPILE_CACHE) >= _COMPILE_CACHE_MAXSIZE:
+                _COMPILE_CACHE.clear()
+            _COMPILE_CACHE[shared_key] = pattern
+        # Most Regex's are never compiled, so the cache is only made when needed
+        if compiled is None:
+            compiled = self._compiled = {}
+        compiled[key] = pattern
+        return pattern
+
+    def finalized(self, *args: Any, **kwargs: Any) -> "Regex":
+        """
+        Returns a copy of this Regex which carries its compiled pattern.
+
+        Calling `compile` on the result without any parameters returns that pattern directly,
+        so build and finalize a Regex once then call `compile` as often as you like.
+        Calls with parameters, including `engine`, compile as usual.
+
+        .. testsetup::
+
+            from iregex import Regex
+
+        .. doctest::
+
+            >>> import re
+            >>> regex = Regex("hello").finalized(re.IGNORECASE)
+            >>> regex.compile().fullmatch("HELLO") is not None
+            True
+
+        :param args: Positional parameters to pass to `compile`.
+        :param kwargs: Keyword parameters to pass to `compile`.
+        """
+        out = self._clone()
+        out._finalized = out.compile(*args, **kwargs)
+        return out
+
+    def compile_dfa(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Compiles with `re2 <https://pypi.org/project/google-re2/>`_, a DFA based engine.
+
+        DFA engines match in time linear in the length of the text regardless of the pattern,
+        which makes them the best choice for scanning long texts with a pattern that is compiled
+        once and matched many times. In exchange they don't support lookarounds or backreferences.
+
+        Like `compile`, the result is cached on this object.
+
+        :param args: Positional parameters to pass to re2.compile.
+        :param kwargs: Keyword parameters to pass to re2.compile.
+        :raises UnsupportedForDFAException: If this regex uses lookarounds or backreferences.
+        :raises ImportError: If re2 is not installed.
         """
-        return re.compile(str(self), *args, **kwargs)
+        if _DFA_UNSUPPORTED_RE.search(self._str):
+            raise UnsupportedForDFAException(
+                f"{self} uses lookarounds or backreferences."
+            )
+        return self.compile(*args, engine="re2", **kwargs)
 
     # ============== Magic Methods ==============
     def __copy__(self) -> "Regex":
-        """A simple copy command."""
-        out = Regex()
-        out._data = copy(self._data)
-        out._capture_groups = copy(self._capture_groups)
-        return out
+        """Regex's are immutable, so a copy is just the same object."""
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Regex":
+        """Regex's are immutable, so a deep copy is just the same object."""
+        return self
 
     def __str__(self) -> str:
         """Converts this object into a regex string."""
-        return "".join(self._data)
+        return self._str
 
     def __repr__(self) -> str:
         """For debugging and printing."""
-        return 'Regex(r"' + str(self) + '")'
+        return 'Regex(r"' + self._str + '")'
 
     def __eq__(self, other: "Regex") -> bool:  # type: ignore
         """Two Regex's are equal if their regex strings are equal."""
-        return str(self) == str(other)
+        if type(other) is Regex:
+            return self._str == other._str
+        return self._str == str(other)
 
     def __hash__(self) -> int:
         """Hashes the string representation."""
-        return hash(str(self))
+        return hash(self._str)
 
-    def __add__(self, other: Union["Regex", str]) -> "Regex":
+    def __len__(self) -> int:
         """
-        Adding two Regex's is just appending their strings.
-        But they aren't allowed to share capture group names.
-        Can be used as an easy substitute for literal. But is a little slower.
+        The length of the regex string, so an empty Regex is falsy.
+
+        .. testsetup::
+
+            from iregex import Regex
+
+        .. doctest::
+
+            >>> len(Regex("[asdf]"))
+            6
+
+            >>> bool(Regex())
+            False
+
+        """
+        return len(self._str)
+
+    @staticmethod
+    def _coerce(other: Union["Regex", str]) -> "Regex":
+        """
+        Converts strings into Regex's and passes Regex's through.
 
-        :raises SetIntersectionError: If the two _capture_groups share any values.
         :raises TypeError: If other is not either a Regex or a string.
         """
-        # Handle data types
+        # Exact type checks first, they are cheaper than isinstance for the common cases
+        t = type(other)
+        if t is Regex:
+            return cast(Regex, other)
+        if t is str:
+            return Regex(cast(str, other))
+        if isinstance(other, Regex):
+            return other
         if isinstance(other, str):
-            other_ = Regex(other)
-        elif isinstance(other, Regex):
-            other_ = other
-            if set(self._capture_groups) & set(other._capture_groups):
+            return Regex(other)
+        raise TypeError(f"Unrecognized type: {type(other)}")
+
+    @staticmethod
+    def _concat(left: "Regex", right: "Regex") -> "Regex":
+        """
+        Appends right to left.
+
+        :raises SetIntersectionError: If the two _capture_groups share any values.
+        """
+        if not left._capture_groups:
+            capture_groups = right._capture_groups
+        elif not right._capture_groups:
+            capture_groups = left._capture_groups
+        else:
+            common = left._capture_groups & right._capture_groups
+            if common:
                 raise SetIntersectionError(
-                    "Capture groups in self and other have common names."
+                    f"Capture groups in self and other have common names: {sorted(common)}"
                 )
-        else:
-            raise TypeError(f"Unrecognized type: {type(other)}")
-        del other  # So you don't reuse the variable
+            capture_groups = left._capture_groups | right._capture_groups
+        return Regex._wrap(left._str + right._str, capture_groups)
 
-        out = Regex()
-        out._data = self._data + other_._data
-        out._capture_groups = self._capture_groups + other_._capture_groups
-        return out
+    def __add__(self, other: Union["Regex", str]) -> "Regex":
+        """
+        Adding two Regex's is just appending their strings.
+        But they aren't allowed to share capture group names.
+        Can be used as an easy substitute for `literal`.
+
+        :raises SetIntersectionError: If the two _capture_groups share any values.
+        :raises TypeError: If other is not either a Regex or a string.
+        """
+        # Plain strings carry no capture groups, so they can be appended directly
+        if type(other) is str:
+            return self._with_suffix(other)
+        return Regex._concat(self, Regex._coerce(other))
 
     def __radd__(self, other: Union["Regex", str]) -> "Regex":
         """
         Adding two Regex's is just appending their strings.
         But they aren't allowed to share capture group names.
-        Can be used as an easy substitute for literal. But is a little slower.
+        Can be used as an easy substitute for `literal`.
 
         :raises SetIntersectionError: If the two _capture_groups share any values.
         :raises TypeError: If other is not either a Regex or a string.
         """
-        # Handle data types
-        if isinstance(other, str):
-            other_ = Regex(other)
-        elif isinstance(other, Regex):
-            other_ = other
-            if set(self._capture_groups) & set(other._capture_groups):
-                raise SetIntersectionError(
-                    "Capture groups in self and other have common names."
+        if type(other) is str:
+            return Regex._wrap(other + self._str, self._capture_groups)
+        return Regex._concat(Regex._coerce(other), self)
+
+    @staticmethod
+    def _or(left: "Regex", right: "Regex") -> "Regex":
+        """
+        Builds the group `(?:left|right)`, merging into existing non capture groups.
+
+        A prefix of plain characters shared by both is moved out of the group,
+        so `ab|ac` becomes `a(?:b|c)` and the engine only matches the `a` once.
+
+        :raises NonEmptyError: If either contains named capture groups.
+        """
+        if left._capture_groups or right._capture_groups:
+            raise NonEmptyError(
+                "Capture groups must be empty to or. "
+                f"Found: {sorted(left._capture_groups | right._capture_groups)}"
+            )
+        left_body = left._str
+        if Regex._classify(left_body) is _Kind.NON_CAPTURE:
+            left_body = Regex._group_body(left_body, _Kind.NON_CAPTURE)
+        right_body = right._str
+        if Regex._classify(right_body) is _Kind.NON_CAPTURE:
+            right_body = Regex._group_body(right_body, _Kind.NON_CAPTURE)
+        # Factoring out a shared prefix is only safe without other alternatives
+        if _OR not in left_body and _OR not in right_body:
+            # Collapsing would drop the groups of one side and renumber the rest
+            if left_body == right_body and _OPEN not in left_body:
+                return Regex._wrap(left_body)
+            i = Regex._common_literal_prefix(left_body, right_body)
+            if i:
+                return Regex._wrap(
+                    left_body[:i]
+                    + _NC_OPEN
+                    + left_body[i:]
+                    + _OR
+                    + right_body[i:]
+                    + _CLOSE
                 )
-        else:
-            raise TypeError(f"Unrecognized type: {type(other)}")
-        del other  # So you don't reuse the variable
+        return Regex._wrap(_NC_OPEN + left_body + _OR + right_body + _CLOSE)
 
-        out = Regex()
-        out._data = other_._data + self._data
-        out._capture_groups = other_._capture_groups + self._capture_groups
-        return out
+    @staticmethod
+    def _common_literal_prefix(left: str, right: str) -> int:
+        """
+        The length of the longest prefix of plain characters shared by left and right.
+
+        The prefix never ends right before a quantifier, which would otherwise
+        be separated from the character it repeats.
+        """
+        i = 0
+        for a, b in zip(left, right):
+            if a != b or a in _METACHARS:
+                break
+            i += 1
+        while i and (
+            left[i:].startswith(_QUANTIFIER_STARTS)
+            or right[i:].startswith(_QUANTIFIER_STARTS)
+        ):
+            i -= 1
+        return i
 
     def __or__(self, other: Union[str, "Regex"]) -> "Regex":
         """
         The `or` of two Regex's is the group `(self|other)`.
         Neither self nor other may contained named capture groups.
 
-        :raises NonEmptyError: If either contains named capture groups.
-        """
-        # Handle data types
-        if isinstance(other, str):
-            other_ = Regex(other)
-        elif isinstance(other, Regex):
-            other_ = other
-            if other._capture_groups:
-                raise NonEmptyError(
-                    f"Capture groups in other is not empty. Found: {other._capture_groups}"
-                )
-        else:
-            raise TypeError(f"Unrecognized type: {type(other)}")
-        del other  # So you don't reuse the variable
+        .. testsetup::
 
-        # Some other errors
-        if self._capture_groups:
-            raise NonEmptyError(
-                f"Capture groups in self is not empty. Found: {self._capture_groups}"
-            )
+            from iregex import Regex
 
-        out = Regex()
-        if Regex._is_non_capture_group(self):
-            out._data = ["(?:", str(self)[3:-1], "|"]
-            if Regex._is_non_capture_group(other_):
-                out._data += [str(other_)[3:-1], ")"]
-            else:
-                out._data += other_._data + [")"]
-        elif Regex._is_non_capture_group(other_):
-            out._data = ["(?:", str(self), "|", str(other_)[3:-1], ")"]
-        else:
-            out._data = ["(?:"] + self._data + ["|"] + other_._data + [")"]
-        out._capture_groups = []
-        return out
+        .. doctest::
+
+            >>> Regex("hello") | "world"
+            Regex(r"(?:hello|world)")
+
+            >>> Regex("hello") | "help"
+            Regex(r"hel(?:lo|p)")
+
+        :raises NonEmptyError: If either contains named capture groups.
+        """
+        return Regex._or(self, Regex._coerce(other))
 
     def __ror__(self, other: Union[str, "Regex"]) -> "Regex":
         """
@@ -653,38 +1097,172 @@ class Regex:
 
         :raises NonEmptyError: If either contains named capture groups.
         """
-        # Handle data types
-        if isinstance(other, str):
-            other_ = Regex(other)
-        elif isinstance(other, Regex):
-            other_ = other
-            if other._capture_groups:
-                raise NonEmptyError(
-                    f"Capture groups in other is not empty. Found: {other._capture_groups}"
-                )
-        else:
-            raise TypeError(f"Unrecognized type: {type(other)}")
-        del other  # So you don't reuse the variable
+        return Regex._or(Regex._coerce(other), self)
+
+
+class RegexBuilder:
+    r"""
+    A mutable counterpart of `Regex` for building long chains in place.
+
+    Every chained method of `Regex` is available, but instead of returning a new `Regex`
+    each one modifies the builder and returns it.
+    Appending methods like `literal` don't rebuild the pattern at all,
+    which saves allocating a throwaway `Regex` for every step of the chain.
+    Call `build` at the end to get an ordinary immutable `Regex`.
+
+    .. testsetup::
+
+        from iregex import Regex, RegexBuilder
 
-        # Some other errors
+    .. doctest::
+
+        >>> RegexBuilder("hello").whitespace().literal("world").optional().build()
+        Regex(r"(?:hello\s*world)?")
+
+        >>> Regex("hello").builder().any_char("a", "b").build()
+        Regex(r"hello[ab]")
+
+    :param regex_str: An optional literal to start your Regex with.
+    """
+
+    __slots__ = ("_parts", "_capture_groups")
+
+    # Private Variables
+    _parts: List[str]
+    _capture_groups: Set[str]
+
+    def __init__(self, regex_str: Optional[Union[Regex, str]] = None) -> None:
+        """Optionally can take a literal as input."""
+        self._parts = []
+        self._capture_groups = set()
+        if regex_str:
+            self.literal(regex_str)
+
+    def build(self) -> Regex:
+        """Makes an immutable `Regex` out of everything added so far."""
         if self._capture_groups:
-            raise NonEmptyError(
-                f"Capture groups in self is not empty. Found: {self._capture_groups}"
-            )
+            return Regex._wrap("".join(self._parts), frozenset(self._capture_groups))
+        return Regex._wrap("".join(self._parts))
 
-        out = Regex()
-        if Regex._is_non_capture_group(other_):
-            out._data = ["(?:", str(other_)[3:-1], "|"]
-            if Regex._is_non_capture_group(self):
-                out._data += [str(self)[3:-1], ")"]
-            else:
-                out._data += self._data + [")"]
-        elif Regex._is_non_capture_group(self):
-            out._data = ["(?:", str(other_), "|", str(self)[3:-1], ")"]
-        else:
-            out._data = ["(?:"] + other_._data + ["|"] + self._data + [")"]
-        out._capture_groups = []
-        return out
+    def _replace(self, regex: Regex) -> "RegexBuilder":
+        """Replaces everything added so far with the given Regex."""
+        self._parts = [regex._str]
+        self._capture_groups = set(regex._capture_groups)
+        return self
+
+    # ============== Appending Methods ==============
+    def literal(self, regex: Union[Regex, str]) -> "RegexBuilder":
+        """
+        A mutating version of `Regex.literal`.
+
+        :raises SetIntersectionError: If the two _capture_groups share any values.
+        :raises TypeError: If regex is not either a Regex or a string.
+        """
+        if type(regex) is str:
+            self._parts.append(regex)
+            return self
+        regex_ = Regex._coerce(regex)
+        if regex_._capture_groups:
+            common = regex_._capture_groups & self._capture_groups
+            if common:
+                raise SetIntersectionError(
+                    f"Capture groups in self and other have common names: {sorted(common)}"
+                )
+            self._capture_groups |= regex_._capture_groups
+        self._parts.append(regex_._str)
+        return self
+
+    def anything(self) -> "RegexBuilder":
+        """A mutating version of `Regex.anything`."""
+        self._parts.append(_ANY_STAR)
+        return self
+
+    def whitespace(self) -> "RegexBuilder":
+        """A mutating version of `Regex.whitespace`."""
+        self._parts.append(_WS_STAR)
+        return self
+
+    def newlines(self) -> "RegexBuilder":
+        """A mutating version of `Regex.newlines`."""
+        self._parts.append(_NL_STAR)
+        return self
+
+    def any_char(self, *char: Union[Regex, str]) -> "RegexBuilder":
+        """
+        A mutating version of `Regex.any_char`.
+
+        :raises NotACharacterException: Raised if any argument is not a character.
+        """
+        self._parts.append(Regex().any_char(*char)._str)
+        return self
+
+    def exclude_char(self, *char: Union[Regex, str]) -> "RegexBuilder":
+        """
+        A mutating version of `Regex.exclude_char`.
+
+        :raises NotACharacterException: Raised if any argument is not a character.
+        """
+        self._parts.append(Regex().exclude_char(*char)._str)
+        return self
+
+    # ============== Wrapping Methods ==============
+    def zero_or_more_repetitions(self) -> "RegexBuilder":
+        """A mutating version of `Regex.zero_or_more_repetitions`."""
+        return self._replace(self.build().zero_or_more_repetitions())
+
+    def one_or_more_repetitions(self) -> "RegexBuilder":
+        """A mutating version of `Regex.one_or_more_repetitions`."""
+        return self._replace(self.build().one_or_more_repetitions())
+
+    def repeat(
+        self, m: int, n: Optional[int] = None, greedy: bool = True
+    ) -> "RegexBuilder":
+        """A mutating version of `Regex.repeat`."""
+        return self._replace(self.build().repeat(m, n, greedy))
+
+    def m_to_n_repetitions(self, m: int, n: int) -> "RegexBuilder":
+        """A mutating version of `Regex.m_to_n_repetitions`."""
+        return self._replace(self.build().m_to_n_repetitions(m, n))
+
+    def exactly_m_repetitions(self, m: int) -> "RegexBuilder":
+        """A mutating version of `Regex.exactly_m_repetitions`."""
+        return self._replace(self.build().exactly_m_repetitions(m))
+
+    def m_or_more_repetitions(self, m: int) -> "RegexBuilder":
+        """A mutating version of `Regex.m_or_more_repetitions`."""
+        return self._replace(self.build().m_or_more_repetitions(m))
+
+    def optional(self) -> "RegexBuilder":
+        """A mutating version of `Regex.optional`."""
+        return self._replace(self.build().optional())
+
+    def make_capture_group(self) -> "RegexBuilder":
+        """A mutating version of `Regex.make_capture_group`."""
+        return self._replace(self.build().make_capture_group())
+
+    def make_non_capture_group(self) -> "RegexBuilder":
+        """A mutating version of `Regex.make_non_capture_group`."""
+        return self._replace(self.build().make_non_capture_group())
+
+    def make_named_capture_group(self, name: str) -> "RegexBuilder":
+        """A mutating version of `Regex.make_named_capture_group`."""
+        return self._replace(self.build().make_named_capture_group(name))
+
+    def make_lookahead(self) -> "RegexBuilder":
+        """A mutating version of `Regex.make_lookahead`."""
+        return self._replace(self.build().make_lookahead())
+
+    def make_lookbehind(self) -> "RegexBuilder":
+        """A mutating version of `Regex.make_lookbehind`."""
+        return self._replace(self.build().make_lookbehind())
+
+    def make_negative_lookahead(self) -> "RegexBuilder":
+        """A mutating version of `Regex.make_negative_lookahead`."""
+        return self._replace(self.build().make_negative_lookahead())
+
+    def make_negative_lookbehind(self) -> "RegexBuilder":
+        """A mutating version of `Regex.make_negative_lookbehind`."""
+        return self._replace(self.build().make_negative_lookbehind())
 
 
 # Some Functional Definitions
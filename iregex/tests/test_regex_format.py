@@ -2,21 +2,27 @@
 Tests Regex class by testing output string representation.
 """
 
+import re
+import sys
+from copy import copy, deepcopy
 from typing import Callable
 
 import pytest
 
+import iregex
 from iregex import Regex
 from iregex.consts import (
     ALPHA,
     ANY_CHAR,
     ANYTHING,
+    NEWLINE,
     NUMERIC,
     ONE_OR_MORE,
     WHITESPACE,
     ZERO_OR_MORE,
 )
 from iregex.exceptions import (
+    AlreadyRepeatingException,
     NonEmptyError,
     NotACharacterException,
     SetIntersectionError,
@@ -58,6 +64,7 @@ def test_one_or_more_repetitions(regex: Regex, result: str) -> None:
     [
         (NUMERIC.m_to_n_repetitions(3, 5), f"{NUMERIC}" + "{3,5}"),
         ((NUMERIC + ALPHA).m_to_n_repetitions(3, 5), f"(?:{NUMERIC+ALPHA})" + "{3,5}",),
+        (NUMERIC.m_to_n_repetitions(3, 20), f"{NUMERIC}" + "{3,20}"),
     ],
 )
 def test_m_to_n_repetitions(regex: Regex, result: str) -> None:
@@ -70,6 +77,7 @@ def test_m_to_n_repetitions(regex: Regex, result: str) -> None:
     [
         (NUMERIC.exactly_m_repetitions(3), f"{NUMERIC}" + "{3}"),
         ((NUMERIC + ALPHA).exactly_m_repetitions(3), f"(?:{NUMERIC+ALPHA})" + "{3}",),
+        (NUMERIC.exactly_m_repetitions(20), f"{NUMERIC}" + "{20}"),
     ],
 )
 def test_exactly_m_repetitions(regex: Regex, result: str) -> None:
@@ -82,6 +90,7 @@ def test_exactly_m_repetitions(regex: Regex, result: str) -> None:
     [
         (NUMERIC.m_or_more_repetitions(3), f"{NUMERIC}" + "{3,}"),
         ((NUMERIC + ALPHA).m_or_more_repetitions(3), f"(?:{NUMERIC+ALPHA})" + "{3,}",),
+        (NUMERIC.m_or_more_repetitions(20), f"{NUMERIC}" + "{20,}"),
     ],
 )
 def test_m_or_more_repetitions(regex: Regex, result: str) -> None:
@@ -89,6 +98,33 @@ def test_m_or_more_repetitions(regex: Regex, result: str) -> None:
     assert str(regex) == result
 
 
+@pytest.mark.parametrize(
+    "regex,result",
+    [
+        (NUMERIC.repeat(3), f"{NUMERIC}" + "{3}"),
+        (NUMERIC.repeat(3, 5), f"{NUMERIC}" + "{3,5}"),
+        ((NUMERIC + ALPHA).repeat(3, 5), f"(?:{NUMERIC+ALPHA})" + "{3,5}"),
+        (NUMERIC.repeat(3, 5, greedy=False), f"{NUMERIC}" + "{3,5}?"),
+        (NUMERIC.builder().repeat(3, 5).build(), f"{NUMERIC}" + "{3,5}"),
+    ],
+)
+def test_repeat(regex: Regex, result: str) -> None:
+    """Test repetitions with the combined repeat method."""
+    assert str(regex) == result
+
+
+def test_repeat_already_repeating() -> None:
+    """Test that a lazy repetition can't be repeated again."""
+    with pytest.raises(AlreadyRepeatingException):
+        NUMERIC.repeat(3, 5, greedy=False).repeat(2)
+
+
+def test_m_or_more_repetitions_negative() -> None:
+    """Test that a negative m is rejected."""
+    with pytest.raises(ValueError):
+        NUMERIC.m_or_more_repetitions(-1)
+
+
 @pytest.mark.parametrize(
     "regex,result",
     [
@@ -103,7 +139,20 @@ def test_optional(regex: Regex, result: str) -> None:
 
 @pytest.mark.parametrize(
     "regex,result",
-    [(Regex().any_char("a"), f"a"), (Regex().any_char("a", "b"), f"[ab]"),],
+    [
+        (Regex().any_char("a"), f"a"),
+        (Regex().any_char("a", "b"), f"[ab]"),
+        (Regex("b").any_char("a"), f"ba"),
+        (Regex("c").any_char("a", "b"), f"c[ab]"),
+        (Regex().any_char(r"\-", "a", NUMERIC), r"[\-a\d]"),
+        (Regex().any_char("b", "a", "b", NUMERIC, NUMERIC), r"[ba\d]"),
+        (Regex().any_char("c", "a", "-", "c"), r"[ca-c]"),
+        (Regex().any_char("\\", "d", "d"), r"[\dd]"),
+        (Regex().any_char("\\", "a", "\\", "b"), r"[\a\b]"),
+        (Regex().any_char("^", "^"), r"[^^]"),
+        (Regex().any_char("^", "^", "a"), r"[^^a]"),
+        (Regex().any_char("]", "a", "a"), r"[]aa]"),
+    ],
 )
 def test_any_char(regex: Regex, result: str) -> None:
     """Test basic any_char."""
@@ -112,7 +161,11 @@ def test_any_char(regex: Regex, result: str) -> None:
 
 @pytest.mark.parametrize(
     "regex_lazy",
-    [lambda: Regex().any_char("ab"), lambda: Regex().any_char("a", "bc"),],
+    [
+        lambda: Regex().any_char("ab"),
+        lambda: Regex().any_char("a", "bc"),
+        lambda: Regex().any_char("", "ab"),
+    ],
 )
 def test_any_char_error(regex_lazy: Callable) -> None:
     """Test basic any_char."""
@@ -122,7 +175,11 @@ def test_any_char_error(regex_lazy: Callable) -> None:
 
 @pytest.mark.parametrize(
     "regex,result",
-    [(Regex().exclude_char("a"), f"[^a]"), (Regex().exclude_char("a", "b"), f"[^ab]"),],
+    [
+        (Regex().exclude_char("a"), f"[^a]"),
+        (Regex().exclude_char("a", "b"), f"[^ab]"),
+        (Regex().exclude_char("a", "b", "a"), f"[^ab]"),
+    ],
 )
 def test_exclude_char(regex: Regex, result: str) -> None:
     """Test basic exclude_char."""
@@ -145,6 +202,35 @@ def test_anything() -> None:
     assert str(regex) == NUMERIC + ANY_CHAR + ZERO_OR_MORE
 
 
+def test_literal() -> None:
+    """Test basic literal."""
+    regex = NUMERIC.literal("a").literal(ALPHA)
+    assert str(regex) == NUMERIC + "a" + ALPHA
+
+
+def test_literal_set_intersection_error() -> None:
+    """Tests that literal refuses shared capture group names like add."""
+    with pytest.raises(SetIntersectionError):
+        NUMERIC.make_named_capture_group("name").literal(
+            ALPHA.make_named_capture_group("name")
+        )
+
+
+def test_anything_method() -> None:
+    """Test the chained anything."""
+    assert str(NUMERIC.anything()) == NUMERIC + ANY_CHAR + ZERO_OR_MORE
+
+
+def test_whitespace_method() -> None:
+    """Test the chained whitespace."""
+    assert str(NUMERIC.whitespace()) == NUMERIC + WHITESPACE + ZERO_OR_MORE
+
+
+def test_newlines_method() -> None:
+    """Test the chained newlines."""
+    assert str(NUMERIC.newlines()) == NUMERIC + NEWLINE + ZERO_OR_MORE
+
+
 def test_capture_group1() -> None:
     """Basic test capture group."""
     regex = Regex(NUMERIC + ALPHA).make_capture_group() + ZERO_OR_MORE
@@ -211,12 +297,16 @@ def test_add(self: Regex, other: Regex, result: Regex) -> None:
         (
             NUMERIC.make_named_capture_group("name"),
             ALPHA.make_named_capture_group("name"),
-        )
+        ),
+        (
+            NUMERIC.make_capture_group().make_named_capture_group("name"),
+            ALPHA.make_named_capture_group("name"),
+        ),
     ],
 )
 def test_add_set_intersection_error(self: Regex, other: Regex) -> None:
     """Tests that an add error pops up in certain scenarios."""
-    with pytest.raises(SetIntersectionError):
+    with pytest.raises(SetIntersectionError, match=r"\['name'\]"):
         self + other
 
 
@@ -236,6 +326,13 @@ def test_add_set_intersection_error(self: Regex, other: Regex) -> None:
             Regex(fr"(?:{NUMERIC}|{ALPHA})"),
             f"(?:{WHITESPACE}|{NUMERIC}|{ALPHA})",
         ),
+        (Regex("hello"), "help", "hel(?:lo|p)"),
+        (Regex("ab+"), "abbb", "a(?:b+|bbb)"),
+        (Regex("ab"), "a", "a(?:b|)"),
+        (Regex("ab"), "ab", "ab"),
+        (Regex("(a)"), "(a)", "(?:(a)|(a))"),
+        (Regex("(?:ab|c)"), "ad", "(?:ab|c|ad)"),
+        (Regex("a.b"), "a.c", "a(?:.b|.c)"),
     ],
 )
 def test_or(self: Regex, other: Regex, result: Regex) -> None:
@@ -256,3 +353,92 @@ def test_or_non_empty_error(self: Regex, other: Regex) -> None:
     """Tests that an or error pops up in certain scenarios."""
     with pytest.raises(NonEmptyError):
         self | other
+
+
+def test_copy() -> None:
+    """Tests that copying a Regex reuses the immutable object."""
+    regex = NUMERIC.make_named_capture_group("name")
+    assert copy(regex) is regex
+    assert deepcopy(regex) is regex
+
+
+@pytest.mark.parametrize(
+    "regex_lazy",
+    [
+        lambda: NUMERIC + 1,  # type: ignore
+        lambda: 1 + NUMERIC,  # type: ignore
+        lambda: NUMERIC | 1,  # type: ignore
+        lambda: 1 | NUMERIC,  # type: ignore
+    ],
+)
+def test_operator_type_error(regex_lazy: Callable) -> None:
+    """Tests that operators reject things that aren't a Regex or a string."""
+    with pytest.raises(TypeError):
+        regex_lazy()
+
+
+def test_builder() -> None:
+    """Tests that a builder makes the same Regex as the equivalent chain."""
+    chained = (
+        NUMERIC.literal("a")
+        .whitespace()
+        .any_char("b", "c")
+        .make_named_capture_group("name")
+        .literal(ALPHA)
+        .one_or_more_repetitions()
+    )
+    built = (
+        NUMERIC.builder()
+        .literal("a")
+        .whitespace()
+        .any_char("b", "c")
+        .make_named_capture_group("name")
+        .literal(ALPHA)
+        .one_or_more_repetitions()
+        .build()
+    )
+    assert built == chained
+    with pytest.raises(SetIntersectionError):
+        built + ALPHA.make_named_capture_group("name")
+
+
+def test_builder_set_intersection_error() -> None:
+    """Tests that a builder refuses shared capture group names like add."""
+    builder = NUMERIC.make_named_capture_group("name").builder()
+    with pytest.raises(SetIntersectionError, match=r"\['name'\]"):
+        builder.literal(ALPHA.make_named_capture_group("name"))
+
+
+def test_hash() -> None:
+    """Tests that equal Regex's hash alike, so they can key dicts and sets."""
+    assert hash(Regex("a").literal("b")) == hash(Regex("ab")) == hash("ab")
+    assert len({Regex("ab"), Regex("a") + "b", ALPHA}) == 2
+    assert {ALPHA: 1}[Regex(str(ALPHA))] == 1
+
+
+def test_add_str_keeps_capture_groups() -> None:
+    """Tests that adding plain strings on either side keeps the capture groups."""
+    named = Regex("a").make_named_capture_group("name")
+    assert "b" + named + "c" == Regex(r"b(?<name>a)c")
+    with pytest.raises(SetIntersectionError):
+        ("b" + named) + (named + "c")
+
+
+def test_star_imports_keep_the_regex_module() -> None:
+    """Tests that the consts star import doesn't shadow the iregex.regex module."""
+    assert iregex.regex is sys.modules["iregex.regex"]
+    namespace: dict = {}
+    exec("from iregex import *", namespace)
+    assert namespace["regex"] is sys.modules["iregex.regex"]
+    assert "strings" not in namespace
+    for name in ("os", "sys", "cast", "import_module", "IntEnum", "FrozenSet"):
+        assert name not in namespace
+    assert namespace["RegexBuilder"] is iregex.RegexBuilder
+    assert namespace["NonEmptyError"] is NonEmptyError
+
+
+def test_string_consts_stay_strings() -> None:
+    """Tests that the constants which were always plain strings still are."""
+    for const in (iregex.ASTERISK, iregex.DOLLAR, iregex.QUESTION_MARK, NEWLINE):
+        assert type(const) is str
+    assert re.compile(NEWLINE).fullmatch("\r\n")
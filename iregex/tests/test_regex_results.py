@@ -2,10 +2,24 @@
 Tests Regex class by testing the regex match results on given strings.
 """
 
+import os
+import re
+import subprocess
+import sys
+
 import pytest
 
 from iregex import Regex
-from iregex.consts import NUMERIC
+from iregex.consts import ALPHA, NUMERIC
+from iregex.exceptions import UnsupportedForDFAException
+from iregex.regex import _ENGINES
+
+# Compiled once here rather than once per parametrized case
+ZERO_OR_MORE_NUMERIC = Regex(NUMERIC).zero_or_more_repetitions().compile()
+ONE_OR_MORE_NUMERIC = Regex(NUMERIC).one_or_more_repetitions().compile()
+THREE_TO_FIVE_NUMERIC = Regex(NUMERIC).m_to_n_repetitions(3, 5).compile()
+EXACTLY_THREE_NUMERIC = Regex(NUMERIC).exactly_m_repetitions(3).compile()
+THREE_OR_MORE_NUMERIC = Regex(NUMERIC).m_or_more_repetitions(3).compile()
 
 
 @pytest.mark.parametrize(
@@ -13,11 +27,10 @@ from iregex.consts import NUMERIC
 )
 def test_zero_or_more_repetitions_results(text: str, expected: bool) -> None:
     """Test basic repetitions."""
-    regex = Regex(NUMERIC).zero_or_more_repetitions().compile()
     if expected:
-        assert regex.fullmatch(text)
+        assert ZERO_OR_MORE_NUMERIC.fullmatch(text)
     else:
-        assert not regex.fullmatch(text)
+        assert not ZERO_OR_MORE_NUMERIC.fullmatch(text)
 
 
 @pytest.mark.parametrize(
@@ -34,72 +47,191 @@ def test_zero_or_more_repetitions_results(text: str, expected: bool) -> None:
 )
 def test_one_or_more_repetitions_results(text: str, expected: bool) -> None:
     """Test basic repetitions."""
-    regex = Regex(NUMERIC).one_or_more_repetitions().compile()
     if expected:
-        assert regex.fullmatch(text)
+        assert ONE_OR_MORE_NUMERIC.fullmatch(text)
     else:
-        assert not regex.fullmatch(text)
+        assert not ONE_OR_MORE_NUMERIC.fullmatch(text)
 
 
 @pytest.mark.parametrize(
-    "text,expected,m,n",
+    "text,expected",
     [
-        ("", False, 3, 5),
-        ("1", False, 3, 5),
-        ("12", False, 3, 5),
-        ("123", True, 3, 5),
-        ("12345", True, 3, 5),
-        ("123456", False, 3, 5),
-        ("1a", False, 3, 5),
+        ("", False),
+        ("1", False),
+        ("12", False),
+        ("123", True),
+        ("12345", True),
+        ("123456", False),
+        ("1a", False),
     ],
 )
-def test_m_to_n_repetitions_results(text: str, expected: bool, m: int, n: int) -> None:
+def test_m_to_n_repetitions_results(text: str, expected: bool) -> None:
     """Test basic repetitions."""
-    assert m < n
-    regex = Regex(NUMERIC).m_to_n_repetitions(m, n).compile()
     if expected:
-        assert regex.fullmatch(text)
+        assert THREE_TO_FIVE_NUMERIC.fullmatch(text)
     else:
-        assert not regex.fullmatch(text)
+        assert not THREE_TO_FIVE_NUMERIC.fullmatch(text)
 
 
 @pytest.mark.parametrize(
-    "text,expected,m",
+    "text,expected",
     [
-        ("", False, 3),
-        ("1", False, 3),
-        ("12", False, 3),
-        ("123", True, 3),
-        ("12345", False, 3),
-        ("123456", False, 3),
-        ("1a", False, 3),
+        ("", False),
+        ("1", False),
+        ("12", False),
+        ("123", True),
+        ("12345", False),
+        ("123456", False),
+        ("1a", False),
     ],
 )
-def test_exactly_m_repetitions_results(text: str, expected: bool, m: int) -> None:
+def test_exactly_m_repetitions_results(text: str, expected: bool) -> None:
     """Test basic repetitions."""
-    regex = Regex(NUMERIC).exactly_m_repetitions(m).compile()
     if expected:
-        assert regex.fullmatch(text)
+        assert EXACTLY_THREE_NUMERIC.fullmatch(text)
     else:
-        assert not regex.fullmatch(text)
+        assert not EXACTLY_THREE_NUMERIC.fullmatch(text)
 
 
 @pytest.mark.parametrize(
-    "text,expected,m",
+    "text,expected",
     [
-        ("", False, 3),
-        ("1", False, 3),
-        ("12", False, 3),
-        ("123", True, 3),
-        ("12345", True, 3),
-        ("123456", True, 3),
-        ("1a", False, 3),
+        ("", False),
+        ("1", False),
+        ("12", False),
+        ("123", True),
+        ("12345", True),
+        ("123456", True),
+        ("1a", False),
     ],
 )
-def test_m_or_more_repetitions_results(text: str, expected: bool, m: int) -> None:
+def test_m_or_more_repetitions_results(text: str, expected: bool) -> None:
     """Test basic repetitions."""
-    regex = Regex(NUMERIC).m_or_more_repetitions(m).compile()
     if expected:
-        assert regex.fullmatch(text)
+        assert THREE_OR_MORE_NUMERIC.fullmatch(text)
     else:
-        assert not regex.fullmatch(text)
+        assert not THREE_OR_MORE_NUMERIC.fullmatch(text)
+
+
+def test_compile_is_cached() -> None:
+    """Test that compiling twice with the same parameters reuses the pattern."""
+    regex = Regex(NUMERIC).one_or_more_repetitions()
+    assert regex.compile() is regex.compile()
+    assert regex.compile(re.IGNORECASE) is regex.compile(re.IGNORECASE)
+    assert regex.compile() is not regex.compile(re.IGNORECASE)
+    assert regex.compile(re.IGNORECASE).flags & re.IGNORECASE
+    assert regex.compile(flags=re.IGNORECASE) is regex.compile(flags=re.IGNORECASE)
+
+
+def test_compile_is_shared() -> None:
+    """Test that equal Regex's built separately share one compiled pattern."""
+    assert (NUMERIC + ALPHA).compile() is Regex(str(NUMERIC + ALPHA)).compile()
+    assert (NUMERIC + ALPHA).compile(re.I) is not (NUMERIC + ALPHA).compile()
+
+
+def test_compile_unrecognized_engine() -> None:
+    """Test that an unknown engine name is rejected."""
+    with pytest.raises(ValueError):
+        Regex(NUMERIC).compile(engine="not_an_engine")
+
+
+def test_compile_default_engine_from_environment() -> None:
+    """Test that IREGEX_ENGINE picks the engine compile uses by default."""
+    code = "from iregex import Regex; Regex('a').compile()"
+    env = dict(os.environ, IREGEX_ENGINE="not_an_engine")
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+    assert "Unrecognized engine: not_an_engine" in result.stderr
+
+
+def test_optional_engines_imported_lazily() -> None:
+    """Test that importing iregex doesn't import the optional engines."""
+    code = (
+        "import sys, iregex; "
+        "print(sorted({'regex', 'pcre', 're2'} & set(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_compile_regex_engine() -> None:
+    """Test compiling with the optional regex package."""
+    regex_module = pytest.importorskip("regex")
+    pattern = Regex(NUMERIC).one_or_more_repetitions().compile(engine="regex")
+    assert isinstance(pattern, regex_module.Pattern)
+    assert pattern.fullmatch("123")
+    assert not pattern.fullmatch("1a")
+
+
+@pytest.mark.parametrize(
+    "regex",
+    [
+        ALPHA + NUMERIC.make_lookahead(),
+        ALPHA + NUMERIC.make_negative_lookahead(),
+        NUMERIC.make_lookbehind() + ALPHA,
+        NUMERIC.make_negative_lookbehind() + ALPHA,
+        NUMERIC.make_capture_group() + r"\1",
+        NUMERIC.make_capture_group() + r"\\\1",
+    ],
+)
+def test_compile_dfa_unsupported(regex: Regex) -> None:
+    """Test that lookarounds and backreferences are rejected before compiling."""
+    with pytest.raises(UnsupportedForDFAException):
+        regex.compile_dfa()
+
+
+@pytest.mark.parametrize(
+    "regex", [Regex(r"\\1"), Regex(r"\(?=") + ALPHA, Regex(r"\\\(?!") + ALPHA]
+)
+def test_compile_dfa_escaped(regex: Regex) -> None:
+    """Test that escaped lookaround and backreference syntax isn't rejected."""
+    try:
+        regex.compile_dfa()
+    except ImportError:
+        pass  # re2 isn't installed, but the pattern got past the check
+
+
+def test_compile_dfa() -> None:
+    """Test compiling with the optional re2 package."""
+    pytest.importorskip("re2")
+    pattern = Regex(NUMERIC).one_or_more_repetitions().compile_dfa()
+    assert pattern.fullmatch("123")
+    assert not pattern.fullmatch("1a")
+
+
+def test_finalized() -> None:
+    """Test that a finalized Regex returns its pattern from a bare compile."""
+    regex = Regex(NUMERIC).one_or_more_repetitions()
+    finalized = regex.finalized(re.IGNORECASE)
+    assert finalized == regex
+    assert finalized.compile().flags & re.IGNORECASE
+    assert finalized.compile() is finalized.compile(re.IGNORECASE)
+    assert not regex.compile().flags & re.IGNORECASE
+    assert not (finalized + "a").compile().flags & re.IGNORECASE
+    assert not finalized.compile(engine="re").flags & re.IGNORECASE
+
+
+def test_compile_unhashable_parameters() -> None:
+    """Test that parameters which can't be cached, like regex's named lists, still work."""
+    _ENGINES["stub"] = type("Stub", (), {"compile": staticmethod(lambda *a, **k: k)})
+    try:
+        regex = Regex(r"\L<words>")
+        assert regex.compile(engine="stub", words=["a", "b"]) == {"words": ["a", "b"]}
+        assert regex.compile(engine="stub", words=["c"]) == {"words": ["c"]}
+    finally:
+        del _ENGINES["stub"]
+
+
+def test_finalized_engine() -> None:
+    """Test that a pattern finalized with one engine isn't returned for another."""
+    _ENGINES["stub"] = type("Stub", (), {"compile": staticmethod(lambda *args: args)})
+    try:
+        finalized = Regex("x").finalized(engine="stub")
+        assert finalized.compile() == ("x",)
+        assert finalized.compile(engine="stub") == ("x",)
+        assert isinstance(finalized.compile(engine="re"), re.Pattern)
+    finally:
+        del _ENGINES["stub"]